@@ -26,9 +26,9 @@ def main() -> None:
     print()
     print("Gamma(E) =", Gamma)
     print("T_prob (4x4) =")
-    print(T_prob)
+    print(T_prob.to_dense())
     print()
-    print("Energy density contribution T00 =", T_prob[0, 0], "erg/cm^3")
+    print("Energy density contribution T00 =", T_prob.T00, "erg/cm^3")
 
 
 if __name__ == "__main__":
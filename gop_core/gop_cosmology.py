@@ -1,6 +1,18 @@
 import numpy as np
 
-def compute_pk_gop(k_array, k0=0.1, sigma_k=0.03, amplitude=0.03):
+
+def _bump(k, k0, inv_sigma, amp, out):
+    # out = 1 + amp * exp(-0.5 * ((k - k0) / sigma)^2), in place in out
+    np.subtract(k, k0, out=out)
+    out *= inv_sigma
+    np.square(out, out=out)
+    out *= -0.5
+    np.exp(out, out=out)
+    out *= amp
+    out += 1.0
+
+
+def compute_pk_gop(k_array, k0=0.1, sigma_k=0.03, amplitude=0.03, out=None):
     """
     GoP P(k) modifier for early-phase DESI Lyα/LSS VAC testing.
     This replaces the toy model in scripts/gop_lss_earlytest.py.
@@ -15,11 +27,30 @@ def compute_pk_gop(k_array, k0=0.1, sigma_k=0.03, amplitude=0.03):
         Width of bump. Default = 0.03 h/Mpc.
     amplitude : float
         Height of bump. Default = 0.03 (i.e., 3%).
+    out : numpy array, optional
+        C-contiguous buffer with the shape of k_array to write f(k) into
+        (may be k_array itself). A new array is allocated if omitted.
 
     Returns
     -------
     numpy array
         Multiplicative factor f(k) such that:
         P_GoP(k) = f(k) * P_LCDM(k)
+        float32 if k_array is float32 (no upcast), float64 otherwise;
+        `out` if given.
     """
-    return 1.0 + amplitude * np.exp(-0.5 * ((k_array - k0) / sigma_k)**2)
+    k = np.asarray(k_array)
+    dtype = np.float32 if k.dtype == np.float32 else np.float64
+    k = np.asarray(k, dtype=dtype)
+    if out is None:
+        out = np.empty(k.shape, dtype=dtype)
+    elif out.shape != k.shape or not out.flags.c_contiguous:
+        raise ValueError("out must be a C-contiguous array with the same shape as k_array")
+    _bump(
+        np.ascontiguousarray(k).reshape(-1),
+        dtype(k0),
+        dtype(1.0 / sigma_k),
+        dtype(amplitude),
+        out.reshape(-1),
+    )
+    return out if out.ndim else out[()]
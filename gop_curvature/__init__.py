@@ -11,13 +11,34 @@ from .gop_constants import (
     A_CP,
 )
 
-from .bell_curve_decoherence_kernel import gamma_bell_curve
+from .bell_curve_decoherence_kernel import (
+    gamma_bell_curve,
+    gamma_bell_curve_fixed,
+    make_gamma,
+)
 from .probabilistic_stress_energy import (
+    DiagT,
     rho_psi_effective,
+    rho_psi_effective_out,
     compute_tmunu_prob,
 )
 
 
-from .gop_cosmology import compute_pk_gop
+from gop_core.gop_cosmology import compute_pk_gop
 
-__all__ = ["compute_pk_gop"]
+__all__ = [
+    "C_LIGHT",
+    "G_NEWTON",
+    "KAPPA_A",
+    "E0",
+    "F_ENT",
+    "A_CP",
+    "gamma_bell_curve",
+    "gamma_bell_curve_fixed",
+    "make_gamma",
+    "DiagT",
+    "rho_psi_effective",
+    "rho_psi_effective_out",
+    "compute_tmunu_prob",
+    "compute_pk_gop",
+]
@@ -0,0 +1,28 @@
+# cython: language_level=3
+"""
+Compiled inner loop for the bell-curve decoherence kernel Γ(E).
+
+    Γ(E) = κA * E * exp(1 - E/E0)
+
+Optional accelerator for gamma_bell_curve (bell_curve_decoherence_kernel.py),
+which falls back to numpy when this extension is not built. Build in place
+with, e.g.:
+
+    CFLAGS="-O3 -march=native -ffast-math" cythonize -i gop_curvature/_bell.pyx
+
+With -ffast-math, GCC can vectorize the exp() call through glibc's libmvec.
+"""
+
+cimport cython
+from libc.math cimport exp
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def gamma_bell_curve_c(const double[::1] E, double kappaA, double E0, double[::1] out):
+    """Write Γ(E) for 1-D contiguous float64 E into out (same length)."""
+    cdef Py_ssize_t i, n = E.shape[0]
+    cdef double inv_E0 = 1.0 / E0
+    with nogil:
+        for i in range(n):
+            out[i] = kappaA * E[i] * exp(1.0 - E[i] * inv_E0)
@@ -0,0 +1,68 @@
+"""
+JAX port of the warm-core effective-density chain.
+
+    rho_eff = rho_b + Γ(e_scale * rho_b) * f_ent * (1 + A_CP)
+
+Under ``jax.jit`` XLA fuses the whole elementwise chain into one kernel,
+and ``jax.grad`` gives exact parameter gradients for fitting at the cost
+of roughly two forward evaluations, instead of finite differences.
+
+This module requires JAX. Importing it raises ImportError otherwise, so
+callers should treat it as an optional backend and import it lazily.
+
+NOTE:
+    The pipeline works in float64 throughout. This module does not touch
+    global JAX configuration; call these functions inside
+    ``enable_x64(True)`` (re-exported below) to get float64 results,
+    otherwise JAX computes in float32:
+
+        from gop_curvature._jax_kernels import enable_x64, rho_eff_jax
+
+        with enable_x64(True):
+            rho_eff = rho_eff_jax(rho_b, kappaA, E0, f_ent, A_CP, e_scale)
+
+The exponent is clamped at _EXP_FLOOR exactly as in gop_curvature._kernels,
+so both backends return the same values.
+"""
+
+from __future__ import annotations
+
+import jax
+import jax.numpy as jnp
+
+# Scoped float64 switch: jax.enable_x64 in current JAX, previously
+# jax.experimental.enable_x64 (both accept the new value as argument)
+try:
+    from jax import enable_x64
+except ImportError:  # pragma: no cover - depends on the JAX version
+    try:
+        from jax.experimental import enable_x64
+    except ImportError as e:
+        raise ImportError(
+            f"JAX {jax.__version__} provides neither jax.enable_x64 nor "
+            "jax.experimental.enable_x64; the JAX backend needs a scoped float64 switch."
+        ) from e
+
+from ._kernels import _EXP_FLOOR
+
+
+@jax.jit
+def rho_eff_jax(rho_b, kappaA, E0, f_ent, A_CP, e_scale):
+    """
+    Effective density rho_b + rho_prob with E_local = e_scale * rho_b.
+
+    Parameters mirror GoPParams; e_scale is the linear energy mapping
+    factor (see energy_scale in gop_warm_core_desipipeline.py).
+    """
+    E = rho_b * e_scale
+    x = jnp.maximum(1.0 - E / E0, _EXP_FLOOR)
+    return rho_b + kappaA * E * jnp.exp(x) * f_ent * (1.0 + A_CP)
+
+
+def _sq_residual(rho_b, kappaA, E0, f_ent, A_CP, e_scale, rho_obs):
+    """Sum of squared residuals between the model rho_eff and rho_obs."""
+    return jnp.sum((rho_eff_jax(rho_b, kappaA, E0, f_ent, A_CP, e_scale) - rho_obs) ** 2)
+
+
+# Gradient of the squared residual w.r.t. (kappaA, E0, f_ent, A_CP)
+grad_rho_eff = jax.jit(jax.grad(_sq_residual, argnums=(1, 2, 3, 4)))
@@ -0,0 +1,98 @@
+"""
+Fused elementwise kernels for the GoP warm-core pipeline.
+
+The public functions in this package are written as readable numpy chains
+(E_local -> Γ(E) -> rho_prob). On large radial grids those chains are
+memory-bound: every step allocates and streams a full-length temporary.
+The kernels here evaluate the whole chain in a single pass.
+
+Numba is optional. When it is installed the kernels are compiled with
+``@njit(fastmath=True, cache=True, parallel=True)``; otherwise an equivalent
+numpy implementation with identical signatures is used.
+
+All kernels assume the linear energy mapping used by the pipeline,
+
+    E_local = e_scale * rho_b
+
+where ``e_scale`` is E0/rho_ref in normalized mode and c^2 * V_coh in
+physical mode.
+
+The exponent 1 - E/E0 is clamped at _EXP_FLOOR before exp(). Below that
+Γ(E) is already ~1e-304 * E, and keeping exp() off its underflow/denormal
+slow path matters when parameters are sampled far from the peak.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAVE_NUMBA = False
+
+
+_EXP_FLOOR = -700.0
+
+
+if HAVE_NUMBA:
+
+    @njit(fastmath=True, cache=True, parallel=True)
+    def _rho_prob_kernel(rho_b, e_scale, kappaA, E0, f_ent, A_CP, out):
+        amp = kappaA * f_ent * (1.0 + A_CP)
+        inv_E0 = 1.0 / E0
+        for i in prange(rho_b.size):
+            E = rho_b[i] * e_scale
+            out[i] = amp * E * math.exp(max(1.0 - E * inv_E0, _EXP_FLOOR))
+
+    @njit(fastmath=True, cache=True, parallel=True)
+    def _profile_kernel(r, rho0, r_core, e_scale, kappaA, E0, f_ent, A_CP, rho_b_out, rho_eff_out):
+        amp = kappaA * f_ent * (1.0 + A_CP)
+        inv_E0 = 1.0 / E0
+        inv_rc = 1.0 / r_core
+        for i in prange(r.size):
+            x = r[i] * inv_rc
+            rb = rho0 / (1.0 + x * x)
+            E = rb * e_scale
+            rho_b_out[i] = rb
+            rho_eff_out[i] = rb + amp * E * math.exp(max(1.0 - E * inv_E0, _EXP_FLOOR))
+
+else:
+
+    def _rho_prob_kernel(rho_b, e_scale, kappaA, E0, f_ent, A_CP, out):
+        np.multiply(rho_b, e_scale, out=out)
+        x = 1.0 - out / E0
+        np.maximum(x, _EXP_FLOOR, out=x)
+        with np.errstate(under="ignore", over="ignore"):
+            np.exp(x, out=x)
+        out *= x
+        out *= kappaA * f_ent * (1.0 + A_CP)
+
+    def _profile_kernel(r, rho0, r_core, e_scale, kappaA, E0, f_ent, A_CP, rho_b_out, rho_eff_out):
+        np.divide(r, r_core, out=rho_b_out)
+        np.square(rho_b_out, out=rho_b_out)
+        rho_b_out += 1.0
+        np.divide(rho0, rho_b_out, out=rho_b_out)
+        _rho_prob_kernel(rho_b_out, e_scale, kappaA, E0, f_ent, A_CP, rho_eff_out)
+        rho_eff_out += rho_b_out
+
+
+def _warmup() -> None:
+    """Trigger (cached) compilation so the first real call is not penalized."""
+    if not HAVE_NUMBA:
+        return
+    buf = np.ones(2, dtype=np.float64)
+    # Numba specializes on the writeable flag: cover read-only inputs too,
+    # such as the module-level radial grid in gop_warm_core_desipipeline.
+    buf_ro = buf.copy()
+    buf_ro.setflags(write=False)
+    for r in (buf, buf_ro):
+        _rho_prob_kernel(r, 1.0, 1.0, 1.0, 1.0, 0.0, np.empty_like(buf))
+        _profile_kernel(r, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 0.0, np.empty_like(buf), np.empty_like(buf))
+
+
+_warmup()
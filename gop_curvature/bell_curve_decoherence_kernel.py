@@ -19,6 +19,12 @@ import numpy as np
 
 from .gop_constants import KAPPA_A, E0
 
+try:
+    # Optional compiled loop (build with: cythonize -i gop_curvature/_bell.pyx)
+    from ._bell import gamma_bell_curve_c
+except ImportError:  # pragma: no cover - depends on the environment
+    gamma_bell_curve_c = None
+
 
 def gamma_bell_curve(
     E: float | np.ndarray,
@@ -47,7 +53,46 @@ def gamma_bell_curve(
     - Peaks at E = E0_local.
     - Γ(E0_local) = kappaA * E0_local.
     - Shape is bell-like in log space; decays exponentially for E >> E0.
+    - 1-D contiguous float64 arrays go through the compiled _bell extension
+      when it has been built; everything else uses numpy.
     """
     E_arr = np.asarray(E, dtype=float)
+    if gamma_bell_curve_c is not None and E_arr.ndim == 1 and E_arr.flags.c_contiguous:
+        out = np.empty_like(E_arr)
+        gamma_bell_curve_c(E_arr, float(kappaA), float(E0_local), out)
+        return out
     x = E_arr / E0_local
     return kappaA * E_arr * np.exp(1.0 - x)
+
+
+def make_gamma(kappaA: float, E0_local: float):
+    """
+    Build Γ(E) specialized for fixed (kappaA, E0_local).
+
+    The parameters are baked into the returned function as constants and
+    1/E0 is precomputed, so the per-element divide becomes a multiply.
+
+    Parameters
+    ----------
+    kappaA : float
+        Global amplitude κA.
+    E0_local : float
+        Characteristic energy scale E0.
+
+    Returns
+    -------
+    gamma : callable
+        gamma(E) -> Γ(E) for float or array-like E.
+    """
+    kappaA = float(kappaA)
+    inv_E0 = 1.0 / float(E0_local)
+
+    def _gamma(E):
+        E_arr = np.asarray(E, dtype=float)
+        return kappaA * E_arr * np.exp(1.0 - E_arr * inv_E0)
+
+    return _gamma
+
+
+# Γ(E) for the frozen core-four parameters (KAPPA_A, E0)
+gamma_bell_curve_fixed = make_gamma(KAPPA_A, E0)
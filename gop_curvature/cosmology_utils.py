@@ -5,6 +5,8 @@ cosmological codes. These are intentionally minimal and non-opinionated.
 
 from __future__ import annotations
 
+from collections import OrderedDict
+
 import numpy as np
 
 from .gop_constants import C_LIGHT, G_NEWTON
@@ -27,3 +29,65 @@ def critical_density(H: float) -> float:
     # 3 H^2 / (8 pi G)
     rho_crit = 3.0 * H**2 / (8.0 * np.pi * G_NEWTON)
     return rho_crit
+
+
+# (z, D_C(z)) tables built by z_of_comoving_distance, most recent last
+_DC_TABLES: OrderedDict[tuple, tuple[np.ndarray, np.ndarray]] = OrderedDict()
+_DC_TABLES_SIZE = 16
+
+
+def _comoving_distance_table(cosmo, z_max: float, n: int):
+    """
+    Read-only (z, D_C(z)) grid for one cosmology.
+
+    astropy cosmologies are not hashable, so the table is keyed on
+    repr(cosmo), which lists every parameter (H0, Om0, Tcmb0, Neff, m_nu,
+    ...) along with the class name.
+    """
+    key = (repr(cosmo), z_max, n)
+    table = _DC_TABLES.get(key)
+    if table is not None:
+        _DC_TABLES.move_to_end(key)
+        return table
+
+    zz = np.linspace(0.0, z_max, n)
+    dd = np.asarray(cosmo.comoving_distance(zz).value, dtype=float)
+    zz.setflags(write=False)
+    dd.setflags(write=False)
+    _DC_TABLES[key] = (zz, dd)
+    if len(_DC_TABLES) > _DC_TABLES_SIZE:
+        _DC_TABLES.popitem(last=False)
+    return zz, dd
+
+
+def z_of_comoving_distance(
+    d_array: float | np.ndarray,
+    cosmo,
+    z_max: float = 6.0,
+    n: int = 4096,
+) -> float | np.ndarray:
+    """
+    Vectorized inverse of the comoving distance–redshift relation.
+
+    Tabulates D_C(z) on a uniform grid and inverts it by linear
+    interpolation, replacing per-source calls to astropy's z_at_value.
+    The table is built once per (cosmo, z_max, n) and reused by later calls.
+
+    Parameters
+    ----------
+    d_array : float or numpy.ndarray
+        Comoving distance(s) in Mpc.
+    cosmo : astropy.cosmology.FLRW
+        Cosmology providing comoving_distance(z).
+    z_max : float, optional
+        Upper end of the redshift table. Default is 6.0.
+    n : int, optional
+        Number of table points. Default is 4096.
+
+    Returns
+    -------
+    z : float or numpy.ndarray
+        Redshift(s); distances beyond the table are clipped to [0, z_max].
+    """
+    zz, dd = _comoving_distance_table(cosmo, float(z_max), int(n))
+    return np.interp(d_array, dd, zz)
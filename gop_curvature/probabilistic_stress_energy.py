@@ -13,6 +13,8 @@ IMPORTANT CONVENTION:
 
 from __future__ import annotations
 
+from typing import NamedTuple
+
 import numpy as np
 
 from .gop_constants import (
@@ -57,9 +59,72 @@ def rho_psi_effective(
 
     so that it scales with cosmological dilution similarly to matter.
     """
-    rho_b_arr = np.asarray(rho_b, dtype=float)
-    rho_psi = f_ent * rho_b_arr * (1.0 + z) ** 3
-    return rho_psi
+    rho_b_arr = np.asarray(rho_b)
+    if rho_b_arr.dtype != np.float64:
+        rho_b_arr = rho_b_arr.astype(np.float64)
+    return np.multiply(rho_b_arr, _psi_factor(z, f_ent))
+
+
+def rho_psi_effective_out(
+    rho_b: np.ndarray,
+    z: float,
+    f_ent: float,
+    out: np.ndarray,
+) -> np.ndarray:
+    """
+    Same as rho_psi_effective, but writes into a caller-owned buffer.
+
+    Parameters
+    ----------
+    rho_b : numpy.ndarray
+        Baryonic mass density in g/cm^3 (or a consistent proxy).
+    z : float
+        Cosmological redshift.
+    f_ent : float
+        Entanglement fraction.
+    out : numpy.ndarray
+        Output buffer, broadcast-compatible with rho_b. May be rho_b itself.
+
+    Returns
+    -------
+    out : numpy.ndarray
+        The filled output buffer.
+    """
+    return np.multiply(rho_b, _psi_factor(z, f_ent), out=out)
+
+
+def _psi_factor(z: float, f_ent: float) -> float:
+    """Scalar f_ent * (1 + z)^3, as a multiplication chain (no pow dispatch)."""
+    a = 1.0 + z
+    return f_ent * a * a * a
+
+
+class DiagT(NamedTuple):
+    """
+    Diagonal entries of T^{prob}_{mu nu}, signature (+, -, -, -).
+
+    Each field is a float, or an array of one common shape when
+    compute_tmunu_prob was given array inputs (in the dust case w = 0 the
+    pressure fields are read-only zero views). Contractions with a diagonal
+    metric reduce to 4-term sums over these fields; use to_dense() where a
+    full matrix is needed.
+    """
+
+    T00: float | np.ndarray
+    T11: float | np.ndarray
+    T22: float | np.ndarray
+    T33: float | np.ndarray
+
+    def to_dense(self) -> np.ndarray:
+        """
+        Dense tensor of shape S + (4, 4), where S is the broadcast shape of
+        the fields (a plain 4x4 matrix for scalar fields).
+        """
+        diag = np.stack(np.broadcast_arrays(*self), axis=-1)
+        T = np.zeros(diag.shape + (4,), dtype=float)
+        idx = np.arange(4)
+        T[..., idx, idx] = diag
+        return T
 
 
 def compute_tmunu_prob(
@@ -68,7 +133,9 @@ def compute_tmunu_prob(
     z: float = 0.0,
     f_ent: float = F_ENT,
     eos_w: float = 0.0,
-) -> np.ndarray:
+    dense: bool = False,
+    grid: bool = False,
+) -> DiagT | np.ndarray:
     """
     Compute a simple diagonal T^{prob}_{mu nu} for a homogeneous fluid
     in its rest frame, using the GoP probabilistic curvature ansatz.
@@ -86,16 +153,28 @@ def compute_tmunu_prob(
     eos_w : float, optional
         Effective equation-of-state parameter w for the probabilistic
         fluid: p = w * u. Default is 0 (dust-like).
+    dense : bool, optional
+        If True, return the dense tensor (DiagT.to_dense()) instead of
+        the diagonal representation. Default is False.
+    grid : bool, optional
+        If True, evaluate on the outer product of E and rho_b: fields get
+        shape E.shape + rho_b.shape (e.g. (NE, Nr)), replacing a Python loop
+        over the parameter grid. Default is False (elementwise broadcasting).
 
     Returns
     -------
-    T_prob : numpy.ndarray
-        A 4x4 numpy array representing T^{prob}_{mu nu} in cgs units,
-        with energy density in erg/cm^3 and pressures in erg/cm^3.
+    T_prob : DiagT or numpy.ndarray
+        The diagonal entries DiagT(T00, T11, T22, T33) of T^{prob}_{mu nu}
+        in cgs units, with energy density in erg/cm^3 and pressures in
+        erg/cm^3, and signature (+, -, -, -) assumed.
 
-        The returned tensor is diagonal:
-            diag(T00, T11, T22, T33)
-        with signature (+, -, -, -) assumed.
+        Fields are floats for scalar E and rho_b; for array inputs they
+        are arrays of the broadcast shape S of E and rho_b (or of
+        E.shape + rho_b.shape with grid=True), so N samples cost one
+        vectorized evaluation.
+
+        With dense=True: an array of shape S + (4, 4) (a plain 4x4 matrix
+        for scalar inputs).
 
     Notes
     -----
@@ -121,20 +200,23 @@ def compute_tmunu_prob(
     # Effective probabilistic density rho_Psi
     rho_psi = rho_psi_effective(rho_b_arr, z=z, f_ent=f_ent)
 
-    # Effective probabilistic mass density (do NOT multiply by κA again)
-    rho_eff_prob = Gamma * rho_psi
-
-    # Convert to energy density (erg/cm^3)
-    u_eff_prob = rho_eff_prob * (C_LIGHT ** 2)
-
-    # Build diagonal T^{prob}_{mu nu}
-    T = np.zeros((4, 4), dtype=float)
-    T[0, 0] = u_eff_prob
-
-    # Isotropic pressures: p = w * u
-    p_eff = eos_w * u_eff_prob
-    T[1, 1] = -p_eff
-    T[2, 2] = -p_eff
-    T[3, 3] = -p_eff
-
-    return T
+    # Effective probabilistic mass density (do NOT multiply by κA again),
+    # converted to energy density (erg/cm^3)
+    if grid:
+        u_eff_prob = np.multiply.outer((C_LIGHT ** 2) * Gamma, rho_psi)
+    else:
+        u_eff_prob = (C_LIGHT ** 2) * Gamma * rho_psi
+
+    # Isotropic pressures: Tii = -p = -w * u (dust: a zero-cost broadcast
+    # view with the shape of u instead of a pass over u)
+    if eos_w == 0.0:
+        minus_p = np.broadcast_to(0.0, np.shape(u_eff_prob))
+    else:
+        minus_p = -eos_w * u_eff_prob
+
+    if np.ndim(u_eff_prob) == 0:
+        u_eff_prob = float(u_eff_prob)
+        minus_p = float(minus_p)
+
+    T = DiagT(u_eff_prob, minus_p, minus_p, minus_p)
+    return T.to_dense() if dense else T
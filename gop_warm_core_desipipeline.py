@@ -38,15 +38,29 @@ or with options:
 from __future__ import annotations
 
 import argparse
+import importlib.util
 from dataclasses import dataclass
 from pathlib import Path
 
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
 
 # Canonical constants (single source of truth)
 from gop_curvature.gop_constants import KAPPA_A, E0, F_ENT, A_CP, C_LIGHT
 from gop_curvature.bell_curve_decoherence_kernel import gamma_bell_curve
+from gop_curvature._kernels import _profile_kernel, _rho_prob_kernel
+
+# JAX is optional; only its presence is checked here, the backend itself
+# (gop_curvature._jax_kernels) is imported on first use
+HAVE_JAX = importlib.util.find_spec("jax") is not None
+
+
+# Radial grid used by main(): 0.01 → 63 kpc (fixed, so built once, read-only)
+_R_KPC_GRID = np.logspace(-2, 1.8, 400)
+_R_KPC_GRID.setflags(write=False)
+_LN_R_GRID = np.log(_R_KPC_GRID)
+_LN_R_GRID.setflags(write=False)
 
 
 # -----------------------------
@@ -98,20 +112,35 @@ def compute_E_local(
     E_local : np.ndarray
         Energy scale (erg or consistent proxy) passed into Γ(E).
     """
-    mode = mode.lower().strip()
     rho_b = np.asarray(rho_b, dtype=float)
+    return rho_b * energy_scale(rho_b, params, mode=mode, rho_ref=rho_ref, Lcoh_cm=Lcoh_cm)
+
+
+def energy_scale(
+    rho_b: np.ndarray,
+    params: GoPParams,
+    mode: str = "normalized",
+    rho_ref: float | None = None,
+    Lcoh_cm: float = 1.0e18,
+) -> float:
+    """
+    Scalar factor s such that E_local = s * rho_b (both modes are linear in rho_b).
+
+    Parameters are as for compute_E_local.
+    """
+    mode = mode.lower().strip()
 
     if mode == "normalized":
         # Reference density to make E_local(0) ~ E0 (activates kernel for template usage)
         if rho_ref is None:
             rho_ref = float(rho_b[0]) if rho_b[0] != 0 else 1.0
         rho_ref = float(rho_ref) if rho_ref != 0 else 1.0
-        return params.E0_erg * (rho_b / rho_ref)
+        return params.E0_erg / rho_ref
 
     if mode == "physical":
         # Dimensionally consistent: energy density (rho c^2) times a coherence volume
         V_coh = float(Lcoh_cm) ** 3
-        return rho_b * (C_LIGHT ** 2) * V_coh
+        return (C_LIGHT ** 2) * V_coh
 
     raise ValueError("mode must be one of: 'normalized', 'physical'")
 
@@ -133,15 +162,25 @@ def rho_prob(
     Probabilistic density proxy for warm-core prediction.
 
     r_kpc is unused in the local mapping (kept for future extensions).
-    """
-    E_local = compute_E_local(rho_b, params, mode=mode, rho_ref=rho_ref, Lcoh_cm=Lcoh_cm)
 
-    # Bell-curve decoherence kernel Γ(E) (canonical implementation)
-    Gamma = gamma_bell_curve(E_local, kappaA=params.kappaA, E0_local=params.E0_erg)
+    The E_local -> Γ(E) -> rho_prob chain is evaluated in a single fused pass
+    (see gop_curvature._kernels); intermediates are only materialized for
+    the debug diagnostics. The result has the shape of rho_b (0-d for a
+    scalar rho_b).
+    """
+    shape = np.shape(rho_b)
+    rho_b = np.ascontiguousarray(rho_b, dtype=float)
+    e_scale = energy_scale(rho_b, params, mode=mode, rho_ref=rho_ref, Lcoh_cm=Lcoh_cm)
 
-    rho_p = Gamma * params.f_ent * (1.0 + params.a_cp)
+    rho_p = np.empty_like(rho_b)
+    _rho_prob_kernel(
+        rho_b.ravel(), e_scale, params.kappaA, params.E0_erg, params.f_ent, params.a_cp, rho_p.ravel()
+    )
 
     if debug:
+        E_local = rho_b * e_scale
+        # Bell-curve decoherence kernel Γ(E) (canonical implementation)
+        Gamma = gamma_bell_curve(E_local, kappaA=params.kappaA, E0_local=params.E0_erg)
         safe_rho_b = np.maximum(rho_b, 1e-300)
         print("---- Diagnostics ----")
         print(f"mode                 : {mode}")
@@ -157,7 +196,8 @@ def rho_prob(
         print(f"max(rho_prob/rho_b)   : {np.max(rho_p / safe_rho_b):.6e}")
         print("---------------------")
 
-    return rho_p
+    # ascontiguousarray promotes a scalar rho_b to shape (1,); undo that
+    return rho_p.reshape(shape)
 
 
 # -----------------------------
@@ -173,6 +213,25 @@ def rho_effective(
     Lcoh_cm: float = 1.0e18,
     debug: bool = False,
 ) -> np.ndarray:
+    """
+    Effective density rho_b + rho_prob.
+
+    Uses the JAX backend (gop_curvature._jax_kernels, imported on first
+    use and evaluated in float64) when JAX is installed; falls back to
+    numpy otherwise, and always when debug diagnostics are requested.
+    An installed JAX without a scoped float64 switch raises ImportError
+    rather than silently falling back.
+    """
+    if HAVE_JAX and not debug:
+        from gop_curvature._jax_kernels import enable_x64, rho_eff_jax
+
+        rho_b = np.asarray(rho_b, dtype=float)
+        e_scale = energy_scale(rho_b, params, mode=mode, rho_ref=rho_ref, Lcoh_cm=Lcoh_cm)
+        with enable_x64(True):
+            return np.asarray(
+                rho_eff_jax(rho_b, params.kappaA, params.E0_erg, params.f_ent, params.a_cp, e_scale)
+            )
+
     return rho_b + rho_prob(
         r_kpc,
         rho_b,
@@ -184,18 +243,85 @@ def rho_effective(
     )
 
 
-def inner_slope(r_kpc: np.ndarray, rho: np.ndarray, r_max: float = 1.0) -> float:
+def profile_densities(
+    r_kpc: np.ndarray,
+    params: GoPParams,
+    *,
+    rho0: float = 1.0,
+    r_core_kpc: float = 0.5,
+    mode: str = "normalized",
+    rho_ref: float | None = None,
+    Lcoh_cm: float = 1.0e18,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return (rho_b, rho_eff) for the toy baryonic profile in one fused pass.
+
+    Equivalent to rho_baryon followed by rho_effective, without the
+    intermediate arrays (see gop_curvature._kernels._profile_kernel).
+    """
+    r_kpc = np.ascontiguousarray(r_kpc, dtype=float)
+    # rho_ref defaults to rho_b at the first radius; only that element is needed
+    rho_b_first = rho_baryon(r_kpc[:1], rho0=rho0, r_core_kpc=r_core_kpc)
+    e_scale = energy_scale(rho_b_first, params, mode=mode, rho_ref=rho_ref, Lcoh_cm=Lcoh_cm)
+
+    rho_b = np.empty_like(r_kpc)
+    rho_eff = np.empty_like(r_kpc)
+    _profile_kernel(
+        r_kpc.ravel(),
+        rho0,
+        r_core_kpc,
+        e_scale,
+        params.kappaA,
+        params.E0_erg,
+        params.f_ent,
+        params.a_cp,
+        rho_b.ravel(),
+        rho_eff.ravel(),
+    )
+    return rho_b, rho_eff
+
+
+def inner_slope(
+    r_kpc: np.ndarray,
+    rho: np.ndarray,
+    r_max: float = 1.0,
+    ln_r: np.ndarray | None = None,
+) -> float:
     """
     Estimate inner log-slope d ln(rho) / d ln(r) over (0, r_max] using a
     least-squares fit in log-log space for stability.
+
+    The degree-1 fit is done in closed form (centered covariance / variance),
+    which is what np.polyfit computes without the Vandermonde matrix + SVD.
+    ln_r may be passed as a precomputed np.log(r_kpc) to skip that log.
     """
     mask = (r_kpc > 0) & (r_kpc <= r_max) & (rho > 0)
     if mask.sum() < 3:
         return np.nan
-    x = np.log(r_kpc[mask])
+    x = ln_r[mask] if ln_r is not None else np.log(r_kpc[mask])
     y = np.log(rho[mask])
-    m, _b = np.polyfit(x, y, 1)
-    return float(m)
+    xc = x - x.mean()
+    return float(np.dot(xc, y - y.mean()) / np.dot(xc, xc))
+
+
+def inner_slopes_batch(r_kpc: np.ndarray, rho_MxN: np.ndarray, r_max: float = 1.0) -> np.ndarray:
+    """
+    Inner log-slopes for M profiles sampled on a shared radial grid.
+
+    Same closed-form fit as inner_slope, applied to all rows of rho_MxN
+    (shape (M, N)) at once: one log of the radius window and a single
+    matrix-vector product. Profiles must be positive inside (0, r_max];
+    rows that are not give non-finite slopes.
+    """
+    mask = (r_kpc > 0) & (r_kpc <= r_max)
+    if mask.sum() < 3:
+        return np.full(rho_MxN.shape[0], np.nan)
+    x = np.log(r_kpc[mask])
+    xc = x - x.mean()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Y = np.log(rho_MxN[:, mask])
+    # Centering x alone suffices: sum(xc) == 0 cancels the mean of each row
+    return (Y @ xc) / np.dot(xc, xc)
 
 
 # -----------------------------
@@ -238,10 +364,19 @@ def main():
         action="store_true",
         help="Print diagnostic maxima to confirm Γ(E) and rho_prob are activating.",
     )
+    parser.add_argument(
+        "--show",
+        action="store_true",
+        help="Also display the plot interactively (default: save only, non-interactive Agg backend).",
+    )
     args = parser.parse_args()
 
+    if not args.show:
+        # Headless by default: no GUI backend initialization for batch runs
+        matplotlib.use("Agg")
+
     params = GoPParams()
-    r = np.logspace(-2, 1.8, 400)  # 0.01 → 63 kpc
+    r = _R_KPC_GRID  # 0.01 → 63 kpc
 
     # Print canonical parameters (credibility + reproducibility)
     print("Core-four parameters (imported from gop_curvature.gop_constants):")
@@ -259,19 +394,30 @@ def main():
         print(f"  Lcoh_cm = {args.Lcoh_cm:.3e} cm")
     print()
 
-    rho_b = rho_baryon(r, rho0=args.rho0, r_core_kpc=args.rcore_kpc)
-    rho_eff = rho_effective(
-        r,
-        rho_b,
-        params,
-        mode=args.mode,
-        rho_ref=args.rho_ref,
-        Lcoh_cm=args.Lcoh_cm,
-        debug=args.debug,
-    )
-
-    slope_b = inner_slope(r, rho_b)
-    slope_eff = inner_slope(r, rho_eff)
+    if args.debug:
+        rho_b = rho_baryon(r, rho0=args.rho0, r_core_kpc=args.rcore_kpc)
+        rho_eff = rho_effective(
+            r,
+            rho_b,
+            params,
+            mode=args.mode,
+            rho_ref=args.rho_ref,
+            Lcoh_cm=args.Lcoh_cm,
+            debug=True,
+        )
+    else:
+        rho_b, rho_eff = profile_densities(
+            r,
+            params,
+            rho0=args.rho0,
+            r_core_kpc=args.rcore_kpc,
+            mode=args.mode,
+            rho_ref=args.rho_ref,
+            Lcoh_cm=args.Lcoh_cm,
+        )
+
+    slope_b = inner_slope(r, rho_b, ln_r=_LN_R_GRID)
+    slope_eff = inner_slope(r, rho_eff, ln_r=_LN_R_GRID)
 
     print("=== GoP Warm-Core Prediction (Fixed July 2025 Parameters) ===")
     print(f"Inner slope (baryons only):  {slope_b: .3f}  → cusp")
@@ -303,7 +449,9 @@ def main():
     plt.tight_layout()
     Path("plots").mkdir(exist_ok=True)
     plt.savefig("plots/gop_warm_core_prediction.png", dpi=300, bbox_inches="tight")
-    plt.show()
+    if args.show:
+        plt.show()
+    plt.close(fig)
 
 
 if __name__ == "__main__":
@@ -13,15 +13,19 @@ This is a template harness. You need to:
     - Adjust `load_desi_pk` to the final VAC schema (FITS column names, extensions).
 """
 
+import hashlib
+import io
 import sys
 import os
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 # Ensure repo root is on the Python path so gop_* packages can be imported
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 
 # ----------------------------------------------------------------------
@@ -33,50 +37,121 @@ def load_desi_pk(path: str | Path):
     Load DESI VAC power spectrum file.
 
     Returns:
-        k   : array of k [h/Mpc]
-        pk  : array of P(k) (currently unused in modifier-mode ΔP/P computation)
+        k   : float64 array of k [h/Mpc], sorted in increasing order
+        pk  : float32 array of P(k) (currently unused in modifier-mode ΔP/P computation)
 
     Supports:
-        - FITS files (typical for DESI VACs) if astropy is installed
-        - ASCII 2-column text files as a fallback
+        - FITS files (typical for DESI VACs) if fitsio (preferred) or
+          astropy is installed
+        - HDF5 files with 'k' and 'pk' datasets if h5py is installed
+        - ASCII text files with (k, P(k)) in the first two columns as a
+          fallback (np.loadtxt; other columns are skipped)
 
     NOTE:
         You will likely need to adjust the FITS column names ('K', 'PK')
         to match the DESI VAC schema once public.
     """
     path = Path(path)
+    name = path.name.lower()
 
     # FITS case (DESI VAC style)
-    if path.suffix.lower() in {".fits", ".fit", ".fz"}:
+    if name.endswith((".fits", ".fit", ".fz", ".fits.gz")):
+        # Prefer cfitsio-backed fitsio; it reads only the requested columns
+        try:
+            import fitsio
+        except ImportError:
+            fitsio = None
+
+        if fitsio is not None:
+            # Adjust to actual VAC column names / extension when known
+            data = fitsio.read(str(path), ext=1, columns=["K", "PK"])
+            return _finalize_pk(data["K"], data["PK"])
+
         try:
             from astropy.io import fits
         except ImportError as e:
             raise ImportError(
-                "Reading FITS requires astropy. Install with `pip install astropy` "
-                "or provide an ASCII (k, P(k)) file."
+                "Reading FITS requires fitsio or astropy. Install with `pip install fitsio` "
+                "(or `pip install astropy`) or provide an ASCII (k, P(k)) file."
             ) from e
 
-        with fits.open(path) as hdul:
+        # Lazy HDU loading: only headers up to hdul[1] are parsed, trailing
+        # extensions are never scanned; column data is paged in on demand
+        with fits.open(path, memmap=True, lazy_load_hdus=True, do_not_scale_image_data=True) as hdul:
             # This assumes the power spectrum is in the first extension (hdul[1])
-            data = hdul[1].data
+            table = hdul[1].data
+
+            # Touch only the two columns (adjust to actual VAC names when known);
+            # FITS columns are big-endian, so _finalize_pk's native-dtype casts
+            # make the one copy, before the file is closed
+            return _finalize_pk(table.field("K"), table.field("PK"))
+
+    # HDF5 case
+    if name.endswith((".h5", ".hdf5")):
+        try:
+            import h5py
+        except ImportError as e:
+            raise ImportError(
+                "Reading HDF5 requires h5py. Install with `pip install h5py` "
+                "or provide an ASCII (k, P(k)) file."
+            ) from e
+
+        with h5py.File(path, "r") as f:
+            k = np.ascontiguousarray(f["k"][:])
+            pk = np.ascontiguousarray(f["pk"][:])
+        return _finalize_pk(k, pk)
 
-            # Adjust to actual VAC column names when known
-            k = np.array(data["K"])
-            pk = np.array(data["PK"])
-        return k, pk
+    # ASCII fallback: plain text with (k, P(k)) in the first two columns
+    data = np.loadtxt(path, usecols=(0, 1))
+    return _finalize_pk(data[:, 0], data[:, 1])
 
-    # ASCII fallback: 2-column plain text (k, P(k))
-    data = np.loadtxt(path)
-    k = data[:, 0]
-    pk = data[:, 1]
-    return k, pk
+
+def _load_many(paths, max_workers: int):
+    """
+    Yield load_desi_pk(path) for each path, in input order, reading on a
+    thread pool with at most 2 * max_workers loads in flight (submitted or
+    finished but not yet consumed), so memory stays bounded for long lists.
+    """
+    paths = iter(paths)
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        pending = deque(ex.submit(load_desi_pk, p) for _, p in zip(range(2 * max_workers), paths))
+        while pending:
+            result = pending.popleft().result()
+            # Refill the window before handing the result over
+            next_path = next(paths, None)
+            if next_path is not None:
+                pending.append(ex.submit(load_desi_pk, next_path))
+            yield result
+
+
+def _finalize_pk(k: np.ndarray, pk: np.ndarray):
+    """
+    Return (k, pk) ordered by increasing k, k as float64 and pk as float32.
+
+    Downstream window statistics rely on a monotonic k grid; DESI VACs are
+    already sorted, in which case no reordering happens. k stays in double
+    precision: the window bounds are compared against it, and float32
+    rounding would move edge modes in or out of the window. P(k) is only
+    carried along, so single precision is ample and halves its memory.
+    """
+    if k.size > 1 and np.any(k[1:] < k[:-1]):
+        order = np.argsort(k, kind="stable")
+        k, pk = k[order], pk[order]
+    # Strided (ASCII columns) or big-endian (FITS) inputs come out as
+    # contiguous native arrays; matching contiguous input is not copied
+    return np.ascontiguousarray(k, dtype=np.float64), np.ascontiguousarray(pk, dtype=np.float32)
 
 
 # ----------------------------------------------------------------------
 # 2. GoP prediction hook
 # ----------------------------------------------------------------------
 
-def gop_predict_modifier(k_array: np.ndarray, cosmo_params: dict | None = None) -> np.ndarray:
+def gop_predict_modifier(
+    k_array: np.ndarray,
+    cosmo_params: dict | None = None,
+    out: np.ndarray | None = None,
+    cache_dir: str | Path | None = None,
+) -> np.ndarray:
     """
     Compute GoP-predicted multiplicative modifier f_gop(k) on the same k grid.
 
@@ -85,39 +160,207 @@ def gop_predict_modifier(k_array: np.ndarray, cosmo_params: dict | None = None)
             P_GoP(k) = f_gop(k) * P_LCDM(k)
 
     This calls your canonical implementation in gop_core.gop_cosmology.
+    Results are memoized in process per (k grid contents, cosmo_params) for
+    grids up to _MODIFIER_CACHE_MAX_BYTES. If cache_dir is given (or
+    $GOP_PK_CACHE_DIR is set) they are also persisted there as .npy files;
+    the key includes a fingerprint of gop_core.gop_cosmology, so editing the
+    model invalidates old entries. The result is written into `out` when given (a
+    C-contiguous buffer shaped like k_array, reusable across calls),
+    otherwise into a fresh writable array shaped like k_array (a scalar for
+    scalar k, as compute_pk_gop returns).
+    """
+    shape = np.shape(k_array)
+    if out is not None and (out.shape != shape or not out.flags.c_contiguous):
+        raise ValueError("out must be a C-contiguous array with the same shape as k_array")
+    # Memo, disk cache and model all work on the flat grid; the caller's
+    # shape is restored on the way out
+    k_array = np.ascontiguousarray(k_array).reshape(-1)
+    flat_out = out.reshape(-1) if out is not None else None
+    params_key = tuple(sorted((cosmo_params or {}).items()))
+    if cache_dir is None:
+        cache_dir = os.environ.get(_MODIFIER_CACHE_DIR_ENV) or None
+    cache_dir = str(Path(cache_dir).expanduser()) if cache_dir is not None else None
+
+    key = _modifier_key(k_array, params_key)
+
+    f_gop = _MODIFIER_MEMO.get(key)
+    if f_gop is not None:
+        _MODIFIER_MEMO.move_to_end(key)
+        if out is None:
+            return _with_shape(f_gop.copy(), shape)
+        np.copyto(flat_out, f_gop)
+        return out
+
+    f_gop = _compute_modifier(k_array, params_key, key, cache_dir, out=flat_out)
+    if k_array.nbytes <= _MODIFIER_CACHE_MAX_BYTES:
+        # Shared between cache hits; callers only ever receive copies
+        memo = f_gop.copy()
+        memo.setflags(write=False)
+        _MODIFIER_MEMO[key] = memo
+        if len(_MODIFIER_MEMO) > _MODIFIER_MEMO_SIZE:
+            _MODIFIER_MEMO.popitem(last=False)
+    return out if out is not None else _with_shape(f_gop, shape)
+
+
+def _with_shape(f_gop: np.ndarray, shape: tuple):
+    """Flat modifier reshaped to the caller's k shape; 0-d becomes a scalar."""
+    f_gop = f_gop.reshape(shape)
+    return f_gop if f_gop.ndim else f_gop[()]
+
+
+# In-process LRU memo of modifiers, keyed by _modifier_key digests (so the
+# k grid itself is never held as a key): at most _MODIFIER_MEMO_SIZE entries
+# of at most _MODIFIER_CACHE_MAX_BYTES each
+_MODIFIER_MEMO: OrderedDict[str, np.ndarray] = OrderedDict()
+_MODIFIER_MEMO_SIZE = 8
+_MODIFIER_CACHE_MAX_BYTES = 4 * 1024 * 1024
+
+# Environment variable that enables the on-disk modifier cache (opt-in)
+_MODIFIER_CACHE_DIR_ENV = "GOP_PK_CACHE_DIR"
+
+
+def _modifier_key(k_array: np.ndarray, params_key: tuple) -> str:
+    """
+    Digest of (P(k) model, k grid contents/dtype/shape, cosmo_params), hashed
+    straight from the contiguous k buffer without copying it.
+    """
+    digest = hashlib.blake2b(_model_fingerprint(), digest_size=16)
+    digest.update(k_array)
+    digest.update(f"{k_array.dtype.str}{k_array.shape}{params_key!r}".encode())
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _model_fingerprint() -> bytes:
+    """
+    Identity of the P(k) model: the source of gop_core.gop_cosmology plus
+    the signature (with defaults) of compute_pk_gop.
+    """
+    import inspect
+
+    import gop_core.gop_cosmology as model
+
+    digest = hashlib.blake2b(Path(model.__file__).read_bytes(), digest_size=16)
+    digest.update(str(inspect.signature(model.compute_pk_gop)).encode())
+    return digest.digest()
+
+
+def _compute_modifier(
+    k_array: np.ndarray,
+    params_key: tuple,
+    key: str,
+    cache_dir: str | None,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    compute_pk_gop(k_array, **params, out=out), served from the on-disk
+    cache in cache_dir (if not None) when the entry for `key` (see
+    _modifier_key) has been computed before.
     """
     from gop_core.gop_cosmology import compute_pk_gop
-    return compute_pk_gop(k_array, **(cosmo_params or {}))
+
+    if cache_dir is None:
+        return compute_pk_gop(k_array, **dict(params_key), out=out)
+
+    cache_file = Path(cache_dir) / f"{key}.npy"
+
+    if cache_file.exists():
+        f_gop = np.load(cache_file)
+        if out is None:
+            return f_gop
+        np.copyto(out, f_gop)
+        return out
+
+    f_gop = compute_pk_gop(k_array, **dict(params_key), out=out)
+
+    # Best effort: write to a temporary name and rename atomically, so a
+    # concurrent run never sees a partial file; a read-only cache is fine
+    tmp_file = cache_file.with_name(f"{cache_file.stem}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, "wb") as f:
+            np.save(f, f_gop)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+    finally:
+        try:
+            tmp_file.unlink(missing_ok=True)
+        except OSError:
+            pass
+    return f_gop
 
 
 # ----------------------------------------------------------------------
 # 3. Comparison and plotting
 # ----------------------------------------------------------------------
 
-def compute_delta_pk_over_pk(f_gop: np.ndarray) -> np.ndarray:
+def compute_delta_pk_over_pk(f_gop: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
     """
     Modifier-mode ΔP/P:
         ΔP/P ≈ f_gop(k) - 1
+
+    Written into `out` if given (out=f_gop reuses the modifier's buffer when
+    it is not needed afterwards); otherwise a new array is returned.
     """
-    return f_gop - 1.0
+    return np.subtract(f_gop, 1.0, out=out)
 
 
-def summarize_delta(k: np.ndarray, delta_over_pk: np.ndarray, k_target: float = 0.10, window: float = 0.02):
+def _window_stats(window_delta: np.ndarray):
+    """
+    (count, mean, std) of the ΔP/P values inside the k-window, two-pass
+    with float64 accumulators (also for float32 input).
+    """
+    return (
+        window_delta.size,
+        float(window_delta.mean(dtype=np.float64)),
+        float(window_delta.std(dtype=np.float64)),
+    )
+
+
+def summarize_delta(
+    k: np.ndarray,
+    delta_over_pk: np.ndarray,
+    k_target: float = 0.10,
+    window: float = 0.02,
+    k_sorted: bool | None = None,
+):
     """
     Print a numerical summary of ΔP/P near k_target.
+
+    For k sorted in increasing order (as returned by load_desi_pk) the window
+    is a contiguous slice located by binary search; otherwise a boolean mask
+    is used. Pass k_sorted=True when the ordering is already known, to skip
+    the monotonicity check.
     """
-    mask = (k >= (k_target - window)) & (k <= (k_target + window))
-    if not np.any(mask):
+    # float64 scalars, not (weakly typed) Python floats: searchsorted and the
+    # mask then both compare in float64, whatever k's dtype, so the window
+    # holds the same modes on either path
+    k_lo, k_hi = np.float64(k_target - window), np.float64(k_target + window)
+    if k_sorted is None:
+        k_sorted = bool(np.all(k[1:] >= k[:-1]))
+
+    # Fast path: on sorted k the endpoints alone tell if the window is empty
+    if k_sorted and (k.size == 0 or k[0] > k_hi or k[-1] < k_lo):
         print("No k-modes found in the target window.")
         return
 
-    mean_delta = float(np.mean(delta_over_pk[mask]))
-    std_delta = float(np.std(delta_over_pk[mask]))
+    if k_sorted:
+        lo = int(np.searchsorted(k, k_lo, side="left"))
+        hi = int(np.searchsorted(k, k_hi, side="right"))
+        window_delta = delta_over_pk[lo:hi]
+    else:
+        window_delta = delta_over_pk[(k >= k_lo) & (k <= k_hi)]
+
+    if window_delta.size == 0:
+        print("No k-modes found in the target window.")
+        return
+    n_modes, mean_delta, std_delta = _window_stats(window_delta)
 
     print("--------------------------------------------------")
     print(f" GoP early-phase ΔP/P summary around k ~ {k_target:.3f} h/Mpc")
     print(f" Window: [{k_target - window:.3f}, {k_target + window:.3f}] h/Mpc")
-    print(f" N modes: {int(np.sum(mask))}")
+    print(f" N modes: {n_modes}")
     print(f" Mean ΔP/P: {mean_delta:.3%}")
     print(f" Std  ΔP/P: {std_delta:.3%}")
     print("--------------------------------------------------")
@@ -125,26 +368,77 @@ def summarize_delta(k: np.ndarray, delta_over_pk: np.ndarray, k_target: float =
     print("--------------------------------------------------")
 
 
-def plot_delta(k: np.ndarray, delta_over_pk: np.ndarray, outpath: str | None = None):
+# Plotted k-range [h/Mpc] and the most points worth drawing inside it
+_PLOT_K_RANGE = (0.01, 0.3)
+_PLOT_MAX_POINTS = 2000
+
+
+def _plot_window(k: np.ndarray, delta_over_pk: np.ndarray):
+    """
+    Restrict sorted (k, ΔP/P) to the plotted k-range (plus one neighbour on
+    each side, so the line reaches the axes), decimated to roughly
+    _PLOT_MAX_POINTS points.
+    """
+    k_min, k_max = _PLOT_K_RANGE
+    lo = max(int(np.searchsorted(k, k_min, side="left")) - 1, 0)
+    hi = int(np.searchsorted(k, k_max, side="right")) + 1
+    k, delta_over_pk = k[lo:hi], delta_over_pk[lo:hi]
+    if k.size > _PLOT_MAX_POINTS:
+        step = k.size // _PLOT_MAX_POINTS
+        k, delta_over_pk = k[::step], delta_over_pk[::step]
+    return k, delta_over_pk
+
+
+def plot_delta(k: np.ndarray, delta_over_pk: np.ndarray, outpath: str | None = None, show: bool = False):
+    """
+    Plot ΔP/P vs k, optionally saving to file and/or displaying it.
+
+    k must be sorted (as returned by load_desi_pk).
+    """
+    plot_deltas([(None, k, delta_over_pk)], outpath=outpath, show=show)
+
+
+def plot_deltas(curves, outpath: str | None = None, show: bool = False):
     """
-    Plot ΔP/P vs k and optionally save to file.
+    Plot several ΔP/P vs k curves on one set of axes, optionally saving to
+    file and/or displaying it.
+
+    curves is a sequence of (label, k, delta_over_pk) with sorted k; label may
+    be None. Each curve is trimmed to the plotted k-range and decimated first.
+    Does nothing when there is neither an outpath nor show=True.
     """
-    plt.figure()
-    plt.axhline(0.0, linestyle="--")
-    plt.plot(k, delta_over_pk)
-    plt.xlabel(r"$k \; [h/\mathrm{Mpc}]$")
-    plt.ylabel(r"$\Delta P / P$")
-    plt.title("GoP Early-Phase Prediction: ΔP/P vs k")
-    plt.xlim(0.01, 0.3)
-    plt.grid(True)
+    if outpath is None and not show:
+        return
+
+    # Imported here so runs that only print the summary never load matplotlib;
+    # the backend is left to the caller (main() selects Agg for batch runs)
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots()
+    ax.axhline(0.0, linestyle="--")
+    for label, k, delta_over_pk in curves:
+        # Rasterized: vector outputs (PDF/SVG) embed the dense line as one image
+        ax.plot(*_plot_window(k, delta_over_pk), label=label, rasterized=True)
+    ax.set_xlabel(r"$k \; [h/\mathrm{Mpc}]$")
+    ax.set_ylabel(r"$\Delta P / P$")
+    ax.set_title("GoP Early-Phase Prediction: ΔP/P vs k")
+    ax.set_xlim(*_PLOT_K_RANGE)
+    ax.grid(True)
+    if any(label is not None for label, _k, _d in curves):
+        ax.legend()
 
     if outpath is not None:
         outpath = Path(outpath)
         outpath.parent.mkdir(parents=True, exist_ok=True)
-        plt.savefig(outpath, bbox_inches="tight", dpi=200)
+        # Encode in memory, then hand the file system one large write
+        # (many small writes are slow on shared/parallel file systems)
+        buf = io.BytesIO()
+        fig.savefig(buf, format=outpath.suffix.lstrip(".") or "png", bbox_inches="tight", dpi=150)
+        outpath.write_bytes(buf.getvalue())
         print(f"Saved plot to: {outpath}")
-    else:
+    if show:
         plt.show()
+    plt.close(fig)
 
 
 # ----------------------------------------------------------------------
@@ -160,30 +454,80 @@ def main():
     parser.add_argument(
         "--pk-file",
         required=True,
-        help="Path to DESI VAC power spectrum file (ASCII, FITS, etc.; adjust loader as needed).",
+        nargs="+",
+        help=(
+            "Path(s) to DESI VAC power spectrum files (ASCII, FITS, etc.; adjust loader as needed). "
+            "Several files are processed in one run and share one plot."
+        ),
     )
     parser.add_argument(
         "--plot-out",
         default=None,
         help="Optional output path for the ΔP/P plot (e.g., plots/delta_pk_gop.png).",
     )
+    parser.add_argument(
+        "--show",
+        action="store_true",
+        help="Display the ΔP/P plot interactively (default: non-interactive Agg backend).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help=(
+            "Directory for an on-disk cache of the GoP modifier f_gop(k), reused across runs "
+            f"(default: ${_MODIFIER_CACHE_DIR_ENV} if set, otherwise no disk cache)."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=8,
+        help="Threads used to read several --pk-file inputs concurrently (I/O bound). Default: 8.",
+    )
 
     args = parser.parse_args()
 
-    # 1) Load DESI P(k) (currently unused for modifier-mode ΔP/P)
-    k, _pk_data = load_desi_pk(args.pk_file)
-
-    # 2) Compute GoP multiplicative modifier f_gop(k)
-    f_gop = gop_predict_modifier(k)
-
-    # 3) Compute ΔP/P
-    delta_over_pk = compute_delta_pk_over_pk(f_gop)
-
-    # 4) Summarize around k ~ 0.1 h/Mpc
-    summarize_delta(k, delta_over_pk, k_target=0.10, window=0.02)
-
-    # 5) Plot
-    plot_delta(k, delta_over_pk, outpath=args.plot_out)
+    pk_paths = [Path(p) for p in args.pk_file]
+    want_plot = args.plot_out is not None or args.show
+
+    if want_plot and not args.show:
+        # Headless: no GUI backend initialization for batch runs (selected
+        # before pyplot is first imported)
+        import matplotlib
+
+        matplotlib.use("Agg")
+    curves = []
+    buf = None  # f_gop / ΔP/P buffer, reused across files with matching grids
+
+    # 1) Load DESI P(k) (currently unused for modifier-mode ΔP/P). Reads are
+    #    I/O latency bound and cfitsio releases the GIL, so files are read by a
+    #    bounded thread pool; results arrive in input order.
+    n_jobs = max(1, min(args.jobs, len(pk_paths)))
+    for pk_path, (k, _pk_data) in zip(pk_paths, _load_many(pk_paths, n_jobs)):
+        if len(pk_paths) > 1:
+            print(f"File: {pk_path}")
+
+        # 2) Compute GoP multiplicative modifier f_gop(k) into the shared buffer
+        if buf is None or buf.shape != k.shape or buf.dtype != k.dtype:
+            buf = np.empty_like(k)
+        f_gop = gop_predict_modifier(k, out=buf, cache_dir=args.cache_dir)
+
+        # 3) Compute ΔP/P in place: f_gop is not used past this point
+        delta_over_pk = compute_delta_pk_over_pk(f_gop, out=f_gop)
+
+        # 4) Summarize around k ~ 0.1 h/Mpc
+        summarize_delta(k, delta_over_pk, k_target=0.10, window=0.02, k_sorted=True)
+
+        # Keep only what will be drawn (trimmed + decimated copies, so the
+        # full-length arrays can be freed) until the end
+        if want_plot:
+            k_plot, delta_plot = _plot_window(k, delta_over_pk)
+            label = pk_path.name if len(pk_paths) > 1 else None
+            curves.append((label, k_plot.copy(), delta_plot.copy()))
+
+    # 5) Plot all inputs on one figure (skipped when there is nowhere to send it)
+    if want_plot:
+        plot_deltas(curves, outpath=args.plot_out, show=args.show)
 
 
 if __name__ == "__main__":
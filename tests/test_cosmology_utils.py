@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from gop_curvature.cosmology_utils import z_of_comoving_distance
+
+cosmology = pytest.importorskip("astropy.cosmology")
+
+
+def test_z_of_comoving_distance_inverts_astropy_cosmology():
+    cosmo = cosmology.FlatLambdaCDM(H0=70.0, Om0=0.3)
+    z_true = np.array([0.0, 0.1, 0.55, 1.0, 2.5])
+    d = cosmo.comoving_distance(z_true).value
+
+    z = z_of_comoving_distance(d, cosmo)
+    np.testing.assert_allclose(z, z_true, atol=1e-4)
+
+    # Second call reuses the cached table and gives the same answer
+    np.testing.assert_array_equal(z_of_comoving_distance(d, cosmo), z)
+
+
+def test_z_of_comoving_distance_distinguishes_cosmologies():
+    d = np.array([1000.0, 3000.0])
+    z_a = z_of_comoving_distance(d, cosmology.FlatLambdaCDM(H0=70.0, Om0=0.3))
+    z_b = z_of_comoving_distance(d, cosmology.FlatLambdaCDM(H0=70.0, Om0=0.5))
+    assert np.all(z_b > z_a)